@@ -1,22 +1,26 @@
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+from opentelemetry.sdk.trace.sampling import ALWAYS_ON, ParentBased, Sampler, TraceIdRatioBased
 from opentelemetry import metrics
+from opentelemetry.metrics import Observation
 from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
 from opentelemetry.sdk.resources import Resource
 from opentelemetry._logs import set_logger_provider
-from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
-from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
-from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.instrumentation.flask import FlaskInstrumentor
+from opentelemetry.trace import Status, StatusCode
 import sentry_sdk
 from sentry_sdk.integrations.flask import FlaskIntegration
 from sentry_sdk.integrations.logging import LoggingIntegration
+import atexit
+import collections
+import itertools
 import logging
+import orjson
 import random
+import socket
+import threading
 import time
 import os
 
@@ -42,36 +46,143 @@ if sentry_dsn:
 else:
     print("⚠ Sentry DSN not configured")
 
-# Configure OpenTelemetry Resource
-resource = Resource.create({"service.name": "simple-app"})
+logger = logging.getLogger(__name__)
 
-# Configure logging with OpenTelemetry
-logger_provider = LoggerProvider(resource=resource)
-set_logger_provider(logger_provider)
+# Artificial request latency is demo padding; keep it off unless asked for
+SIMULATE_LATENCY = os.environ.get("SIMULATE_LATENCY", "0") == "1"
 
-# Add OTLP Log Exporter
-otlp_log_exporter = OTLPLogExporter(endpoint="http://otel-collector:4317", insecure=True)
-logger_provider.add_log_record_processor(BatchLogRecordProcessor(otlp_log_exporter))
+# Resolved once so request timing skips the attribute lookup
+_perf = time.perf_counter
 
-# Configure Python logging to use OpenTelemetry handler
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-handler = LoggingHandler(level=logging.NOTSET, logger_provider=logger_provider)
-logger.addHandler(handler)
-
-# Configure tracing
-trace_provider = TracerProvider(resource=resource)
-otlp_exporter = OTLPSpanExporter(endpoint="http://otel-collector:4317", insecure=True)
-span_processor = BatchSpanProcessor(otlp_exporter)
-trace_provider.add_span_processor(span_processor)
-trace.set_tracer_provider(trace_provider)
-tracer = trace.get_tracer(__name__)
-
-# Configure metrics
-metric_reader = PeriodicExportingMetricReader(
-    OTLPMetricExporter(endpoint="http://otel-collector:4317", insecure=True)
-)
-metrics.set_meter_provider(MeterProvider(resource=resource, metric_readers=[metric_reader]))
+# Status objects are immutable, so one instance serves every error span
+_ERR_STATUS = Status(StatusCode.ERROR)
+
+# Per-thread random generators, so request threads don't all share the
+# module-level random instance
+_tls = threading.local()
+
+
+def _rng():
+    rng = getattr(_tls, "rng", None)
+    if rng is None:
+        rng = _tls.rng = random.Random()
+    return rng
+
+
+# Dedicated generator for the simulated system stats, which are mostly
+# sampled from the metric reader's collection thread
+_STATS_RNG = random.Random()
+
+
+def _zero_sum_deltas(size=1 << 16):
+    """Return shuffled -1/0/+1 deltas with equal numbers of -1 and +1.
+
+    Summing to zero keeps active_users a bounded random walk when the
+    buffer is cycled, instead of drifting by the same amount every lap.
+    """
+    third = size // 3
+    deltas = [-1] * third + [1] * third + [0] * (size - 2 * third)
+    random.shuffle(deltas)
+    return deltas
+
+
+# Pre-generated active-user deltas, cycled per request so the handlers
+# don't pay for a random.randint() call each time
+_ACTIVE_USER_DELTAS = itertools.cycle(_zero_sum_deltas())
+
+# Metric attribute sets, built once rather than per request
+ATTR_ROOT_REQ = {"endpoint": "/", "method": "GET"}
+ATTR_ROOT_DUR = {"endpoint": "/"}
+ATTR_ROOT_ERR = {"endpoint": "/", "error_type": "simulated"}
+ATTR_METRICS_REQ = {"endpoint": "/metrics", "method": "GET"}
+ATTR_METRICS_DUR = {"endpoint": "/metrics"}
+ATTR_ERROR_REQ = {"endpoint": "/error", "method": "GET"}
+ATTR_ERR = {"endpoint": "/error", "error_type": "simulated"}
+
+# Counter increments are accumulated per process and drained into the SDK
+# every COUNTER_FLUSH_INTERVAL seconds rather than calling counter.add() on
+# every request. Keys are (counter, endpoint, method-or-error-type).
+COUNTER_FLUSH_INTERVAL = 0.5
+_PENDING = collections.Counter()
+_PENDING_LOCK = threading.Lock()
+_PENDING_ATTRS = {
+    ("req", "/", "GET"): ATTR_ROOT_REQ,
+    ("err", "/", "simulated"): ATTR_ROOT_ERR,
+    ("req", "/metrics", "GET"): ATTR_METRICS_REQ,
+    ("req", "/error", "GET"): ATTR_ERROR_REQ,
+    ("err", "/error", "simulated"): ATTR_ERR,
+}
+
+
+def _count(key):
+    with _PENDING_LOCK:
+        _PENDING[key] += 1
+
+
+def flush_counters():
+    """Add all pending increments to request_counter/error_counter."""
+    global _PENDING
+    with _PENDING_LOCK:
+        pending, _PENDING = _PENDING, collections.Counter()
+    for key, n in pending.items():
+        counter = request_counter if key[0] == "req" else error_counter
+        counter.add(n, _PENDING_ATTRS[key])
+
+
+_FLUSH_STOP = threading.Event()
+
+
+def _counter_flush_loop():
+    while not _FLUSH_STOP.wait(COUNTER_FLUSH_INTERVAL):
+        try:
+            flush_counters()
+        except Exception:
+            logger.exception("Failed to flush pending counter increments")
+
+
+def _start_counter_flusher():
+    threading.Thread(target=_counter_flush_loop, name="counter-flusher", daemon=True).start()
+
+
+def _stop_counter_flusher():
+    _FLUSH_STOP.set()
+    flush_counters()
+
+
+# Last simulated system stats, shared by both gauges and the /metrics
+# endpoint. Each refresh swaps in a new dict, so readers never see a
+# half-updated snapshot.
+_system_snapshot = {}
+_system_sampled_at = float("-inf")
+
+
+# The collection-loop functions below bind their globals as default
+# arguments so each call uses fast local lookups.
+def _system_stats(_perf=_perf, _randint=_STATS_RNG.randint, _uniform=_STATS_RNG.uniform):
+    """Return simulated system stats, refreshed at most every 100ms."""
+    global _system_snapshot, _system_sampled_at
+    now = _perf()
+    if now - _system_sampled_at >= 0.1:
+        _system_snapshot = {
+            "active_users": _randint(50, 200),
+            "memory_usage": _randint(1000000, 2000000),
+            "cpu_usage": _uniform(10, 90)
+        }
+        _system_sampled_at = now
+    return _system_snapshot
+
+
+def _memory_callback(options, _stats=_system_stats, _Observation=Observation):
+    return [_Observation(_stats()["memory_usage"])]  # Simulated memory usage
+
+
+def _cpu_callback(options, _stats=_system_stats, _Observation=Observation):
+    return [_Observation(_stats()["cpu_usage"])]  # Simulated CPU usage
+
+
+# Instruments are created at import from the API's proxy meter, so handlers
+# can always use them; they start exporting once init_telemetry() installs
+# the MeterProvider in this process.
 meter = metrics.get_meter(__name__)
 
 # Create metrics
@@ -103,112 +214,358 @@ memory_usage = meter.create_observable_gauge(
     name="memory_usage_bytes",
     description="Memory usage in bytes",
     unit="bytes",
-    callbacks=[lambda: random.randint(1000000, 2000000)]  # Simulated memory usage
+    callbacks=[_memory_callback]
 )
 
 cpu_usage = meter.create_observable_gauge(
     name="cpu_usage_percent",
     description="CPU usage percentage",
     unit="percent",
-    callbacks=[lambda: random.uniform(10, 90)]  # Simulated CPU usage
+    callbacks=[_cpu_callback]
 )
 
+
+class ErrorRouteSampler(Sampler):
+    """Always sample requests to the given routes, defer the rest to delegate."""
+
+    def __init__(self, delegate, routes=("/error",)):
+        self._delegate = delegate
+        self._routes = frozenset(routes)
+
+    def should_sample(self, parent_context, trace_id, name, kind=None,
+                      attributes=None, links=None, trace_state=None):
+        if attributes and attributes.get("http.route") in self._routes:
+            sampler = ALWAYS_ON
+        else:
+            sampler = self._delegate
+        return sampler.should_sample(parent_context, trace_id, name, kind,
+                                     attributes, links, trace_state)
+
+    def get_description(self):
+        return f"ErrorRouteSampler{{{self._delegate.get_description()}}}"
+
+
+class SampleFilter(logging.Filter):
+    """Pass every WARNING-and-above record but only 1 in n lower-level ones."""
+
+    def __init__(self, n=100):
+        super().__init__()
+        if n < 1:
+            raise ValueError(f"sample rate n must be >= 1, got {n}")
+        self.n = n
+        self._seen = itertools.count()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        return next(self._seen) % self.n == 0
+
+
+# Export over OTLP/HTTP (port 4318) with pooled keep-alive connections
+# instead of gRPC
+USE_HTTP_EXPORTER = os.environ.get("USE_HTTP_EXPORTER", "0") == "1"
+
+# Shared gRPC channel, or None when exporting over HTTP
+otlp_channel = None
+
+
+def on_shared_channel(exporter_cls, channel):
+    """Build an OTLP gRPC exporter that sends over a shared channel.
+
+    Relies on the opentelemetry-exporter-otlp-proto-grpc==1.20.0 pin: that
+    release has no channel argument and builds its stub from the
+    insecure_channel() name in its exporter module, so that name is swapped
+    for the duration of construction and no per-exporter channel is created.
+    """
+    from opentelemetry.exporter.otlp.proto.grpc import exporter as otlp_grpc
+
+    original = otlp_grpc.insecure_channel
+    otlp_grpc.insecure_channel = lambda target, compression=None: channel
+    try:
+        return exporter_cls(endpoint="http://otel-collector:4317", insecure=True)
+    finally:
+        otlp_grpc.insecure_channel = original
+
+
+def _http_session():
+    """Return a keep-alive session for one OTLP/HTTP exporter.
+
+    The exporters already retry with backoff, so the adapter does not.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0))
+    return session
+
+
+def create_exporters():
+    """Build the span, metric and log exporters for the configured protocol."""
+    global otlp_channel
+    if USE_HTTP_EXPORTER:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter as HTTPSpanExporter,
+        )
+        from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+            OTLPMetricExporter as HTTPMetricExporter,
+        )
+        from opentelemetry.exporter.otlp.proto.http._log_exporter import (
+            OTLPLogExporter as HTTPLogExporter,
+        )
+        return (
+            HTTPSpanExporter(endpoint="http://otel-collector:4318/v1/traces",
+                             session=_http_session()),
+            HTTPMetricExporter(endpoint="http://otel-collector:4318/v1/metrics",
+                               session=_http_session()),
+            HTTPLogExporter(endpoint="http://otel-collector:4318/v1/logs",
+                            session=_http_session()),
+        )
+
+    import grpc
+    from opentelemetry.exporter.otlp.proto.grpc.exporter import environ_to_compression
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+    from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
+
+    # Share a single HTTP/2 channel between the trace, metric and log
+    # exporters. The exporters would otherwise apply OTLP compression to
+    # their own channels, so honour OTEL_EXPORTER_OTLP_COMPRESSION here.
+    otlp_channel = grpc.insecure_channel(
+        "otel-collector:4317",
+        options=[
+            ("grpc.keepalive_time_ms", 30000),
+            ("grpc.keepalive_timeout_ms", 10000),
+            ("grpc.http2.max_pings_without_data", 0),
+        ],
+        compression=(
+            environ_to_compression("OTEL_EXPORTER_OTLP_COMPRESSION")
+            or grpc.Compression.NoCompression
+        ),
+    )
+    # Registered before the providers so their shutdown flush runs first
+    atexit.register(otlp_channel.close)
+
+    return (
+        on_shared_channel(OTLPSpanExporter, otlp_channel),
+        on_shared_channel(OTLPMetricExporter, otlp_channel),
+        on_shared_channel(OTLPLogExporter, otlp_channel),
+    )
+
+
+# Set (under _INIT_LOCK) as soon as init_telemetry() starts, so even a call
+# that fails part-way is never repeated on top of half-installed providers
+_INITED = False
+_INIT_LOCK = threading.Lock()
+
+
+def init_telemetry():
+    """Set up OpenTelemetry providers, exporters and processors.
+
+    Safe to call more than once: only the first call in a process installs
+    the global providers, so no orphaned processor threads or channels are
+    left behind by a second initialization. The exporters, processors and
+    their gRPC/protobuf dependencies are imported here rather than at module
+    import time.
+    """
+    global logger_provider, handler, trace_provider, _INITED
+    with _INIT_LOCK:
+        if _INITED:
+            return
+        _INITED = True
+
+    from opentelemetry.sdk._logs import LoggingHandler
+    from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    # Configure OpenTelemetry Resource. Each gunicorn worker exports its own
+    # cumulative counters, so give every process a distinct instance id to
+    # keep their series apart
+    resource = Resource.create({
+        "service.name": "simple-app",
+        "service.instance.id": f"{socket.gethostname()}-{os.getpid()}",
+    })
+
+    otlp_exporter, otlp_metric_exporter, otlp_log_exporter = create_exporters()
+
+    # Configure logging with OpenTelemetry
+    logger_provider = LoggerProvider(resource=resource)
+    set_logger_provider(logger_provider)
+
+    # Add OTLP Log Exporter
+    logger_provider.add_log_record_processor(BatchLogRecordProcessor(
+        otlp_log_exporter,
+        max_queue_size=int(os.getenv('OTEL_BLRP_MAX_QUEUE_SIZE', 4096)),
+        schedule_delay_millis=int(os.getenv('OTEL_BLRP_SCHEDULE_DELAY', 1000)),
+        max_export_batch_size=int(os.getenv('OTEL_BLRP_MAX_EXPORT_BATCH_SIZE', 256)),
+        export_timeout_millis=int(os.getenv('OTEL_BLRP_EXPORT_TIMEOUT', 10000)),
+    ))
+
+    # Configure Python logging to use OpenTelemetry handler
+    # WARNING by default keeps per-request DEBUG logs out of the export
+    # pipeline; set LOG_LEVEL=DEBUG to see them
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'WARNING').upper())
+    handler = LoggingHandler(level=logging.NOTSET, logger_provider=logger_provider)
+    # Sample sub-WARNING records before they reach the OTLP log exporter
+    handler.addFilter(SampleFilter(n=max(1, int(os.getenv('LOG_SAMPLE_N', 100)))))
+    logger.addHandler(handler)
+
+    # Configure tracing
+    # Keep OTEL_TRACES_SAMPLER_ARG (default 5%) of root traces, but always
+    # record the /error endpoint. An explicit OTEL_TRACES_SAMPLER takes over
+    # entirely: passing sampler=None lets the SDK build it from the env.
+    sampler = None
+    if not os.getenv('OTEL_TRACES_SAMPLER'):
+        sampler = ErrorRouteSampler(ParentBased(
+            root=TraceIdRatioBased(float(os.getenv('OTEL_TRACES_SAMPLER_ARG', 0.05)))
+        ))
+    trace_provider = TracerProvider(resource=resource, sampler=sampler)
+    # Larger queue and smaller, more frequent batches keep bursts from dropping
+    # spans while staying well under gRPC's 4MB message limit
+    span_processor = BatchSpanProcessor(
+        otlp_exporter,
+        max_queue_size=int(os.getenv('OTEL_BSP_MAX_QUEUE_SIZE', 4096)),
+        schedule_delay_millis=int(os.getenv('OTEL_BSP_SCHEDULE_DELAY', 1000)),
+        max_export_batch_size=int(os.getenv('OTEL_BSP_MAX_EXPORT_BATCH_SIZE', 128)),
+        export_timeout_millis=int(os.getenv('OTEL_BSP_EXPORT_TIMEOUT', 10000)),
+    )
+    trace_provider.add_span_processor(span_processor)
+    trace.set_tracer_provider(trace_provider)
+
+    # Configure metrics
+    metric_reader = PeriodicExportingMetricReader(
+        otlp_metric_exporter,
+        export_interval_millis=int(os.getenv('OTEL_METRIC_EXPORT_INTERVAL', 10000)),
+        export_timeout_millis=int(os.getenv('OTEL_METRIC_EXPORT_TIMEOUT', 5000)),
+    )
+    metrics.set_meter_provider(MeterProvider(resource=resource, metric_readers=[metric_reader]))
+
+    # Registered after the MeterProvider so the last increments are added
+    # before its shutdown-time export
+    atexit.register(_stop_counter_flusher)
+    _start_counter_flusher()
+
+    # Logged here rather than at import, which runs before logging is set up
+    logger.info("Application starting up...")
+
+
 # Create Flask application
 app = Flask(__name__)
+# Server spans come from the Flask instrumentation's request hooks; the
+# handlers only decorate the current span. No provider is passed so the
+# instrumentation picks up whichever one init_telemetry() installs later.
+FlaskInstrumentor().instrument_app(app)
 
-logger.info("Application starting up...")
+# Constant responses, built once and returned as-is. Nothing in the request
+# pipeline mutates them; copy.copy() one first if a handler ever needs to.
+HELLO_RESPONSE = app.response_class(
+    response=orjson.dumps({"message": "Hello, OpenTelemetry!"}),
+    status=200,
+    mimetype="application/json"
+)
+ERR_RESPONSE = app.response_class(
+    response=orjson.dumps({"error": "Simulated error"}),
+    status=500,
+    mimetype="application/json"
+)
 
 @app.route('/')
 def hello():
-    logger.info("Received request to / endpoint")
-    with tracer.start_as_current_span("hello_operation") as span:
-        span.set_attribute("operation.type", "hello")
-        
-        # Simulate some processing time
-        sleep_time = random.uniform(0.1, 0.5)
-        logger.debug(f"Processing request, sleeping for {sleep_time:.2f} seconds")
+    logger.debug("Received request to / endpoint")
+    span = trace.get_current_span()
+    span.set_attribute("operation.type", "hello")
+    start = _perf()
+    
+    # Simulate some processing time
+    if SIMULATE_LATENCY:
+        sleep_time = _rng().uniform(0.1, 0.5)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing request, sleeping for %.2f seconds", sleep_time)
         time.sleep(sleep_time)
+    
+    # Record metrics
+    _count(("req", "/", "GET"))
+    request_duration.record(_perf() - start, ATTR_ROOT_DUR)
+    
+    # Simulate user activity
+    active_users.add(next(_ACTIVE_USER_DELTAS))
+    
+    # Simulate occasional errors
+    if _rng().random() < 0.1:  # 10% chance of error
+        logger.error("Simulated error occurred at / endpoint", extra={"endpoint": "/", "error_type": "simulated"})
+        _count(("err", "/", "simulated"))
+        span.set_status(_ERR_STATUS)
         
-        # Record metrics
-        request_counter.add(1, {"endpoint": "/", "method": "GET"})
-        request_duration.record(sleep_time, {"endpoint": "/"})
-        
-        # Simulate user activity
-        active_users.add(random.randint(-1, 1))
-        
-        # Simulate occasional errors
-        if random.random() < 0.1:  # 10% chance of error
-            logger.error("Simulated error occurred at / endpoint", extra={"endpoint": "/", "error_type": "simulated"})
-            error_counter.add(1, {"endpoint": "/", "error_type": "simulated"})
-            span.set_status(trace.Status(trace.StatusCode.ERROR))
-            
-            # Capture exception in Sentry
-            try:
-                raise Exception("Simulated error at / endpoint")
-            except Exception as e:
-                sentry_sdk.capture_exception(e)
-                return jsonify({"error": "Simulated error"}), 500
-        
-        logger.info("Successfully processed request to / endpoint")
-        return jsonify({"message": "Hello, OpenTelemetry!"})
+        # Capture exception in Sentry
+        try:
+            raise Exception("Simulated error at / endpoint")
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            return ERR_RESPONSE
+    
+    logger.debug("Successfully processed request to / endpoint")
+    return HELLO_RESPONSE
 
 @app.route('/metrics')
 def metrics_endpoint():
-    logger.info("Received request to /metrics endpoint")
-    with tracer.start_as_current_span("metrics_operation") as span:
-        span.set_attribute("operation.type", "metrics")
-        
-        # Simulate some processing time
-        sleep_time = random.uniform(0.2, 0.8)
-        logger.debug(f"Fetching metrics, processing time: {sleep_time:.2f} seconds")
+    logger.debug("Received request to /metrics endpoint")
+    trace.get_current_span().set_attribute("operation.type", "metrics")
+    start = _perf()
+    
+    # Simulate some processing time
+    if SIMULATE_LATENCY:
+        sleep_time = _rng().uniform(0.2, 0.8)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fetching metrics, processing time: %.2f seconds", sleep_time)
         time.sleep(sleep_time)
-        
-        # Record metrics
-        request_counter.add(1, {"endpoint": "/metrics", "method": "GET"})
-        request_duration.record(sleep_time, {"endpoint": "/metrics"})
-        
-        # Simulate user activity
-        active_users.add(random.randint(-1, 1))
-        
-        metrics_data = {
-            "active_users": random.randint(50, 200),
-            "memory_usage": random.randint(1000000, 2000000),
-            "cpu_usage": random.uniform(10, 90)
-        }
-        logger.info(f"Returning metrics data: active_users={metrics_data['active_users']}, memory_usage={metrics_data['memory_usage']}")
-        
-        return jsonify(metrics_data)
+    
+    # Served from the shared snapshot rather than sampled per request
+    metrics_data = _system_stats()
+    
+    # Record metrics
+    _count(("req", "/metrics", "GET"))
+    request_duration.record(_perf() - start, ATTR_METRICS_DUR)
+    
+    # Simulate user activity
+    active_users.add(next(_ACTIVE_USER_DELTAS))
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Returning metrics data: active_users=%d, memory_usage=%d",
+                     metrics_data['active_users'], metrics_data['memory_usage'])
+    
+    return Response(orjson.dumps(metrics_data), mimetype="application/json")
 
 @app.route('/error')
 def error_endpoint():
     logger.warning("Received request to /error endpoint - intentional error simulation")
-    with tracer.start_as_current_span("error_operation") as span:
-        span.set_attribute("operation.type", "error")
-        
-        # Record metrics
-        request_counter.add(1, {"endpoint": "/error", "method": "GET"})
-        error_counter.add(1, {"endpoint": "/error", "error_type": "simulated"})
-        
-        # Set error status
-        span.set_status(trace.Status(trace.StatusCode.ERROR))
-        
-        logger.error("Intentional error raised at /error endpoint", extra={"endpoint": "/error", "status_code": 500})
+    span = trace.get_current_span()
+    span.set_attribute("operation.type", "error")
+    
+    # Record metrics
+    _count(("req", "/error", "GET"))
+    _count(("err", "/error", "simulated"))
+    
+    # Set error status
+    span.set_status(_ERR_STATUS)
+    
+    logger.error("Intentional error raised at /error endpoint", extra={"endpoint": "/error", "status_code": 500})
+    
+    # Capture in Sentry with context
+    with sentry_sdk.push_scope() as scope:
+        scope.set_tag("endpoint", "/error")
+        scope.set_tag("error_type", "intentional")
+        scope.set_context("request_info", {
+            "endpoint": "/error",
+            "method": "GET",
+            "intentional": True
+        })
         
-        # Capture in Sentry with context
-        with sentry_sdk.push_scope() as scope:
-            scope.set_tag("endpoint", "/error")
-            scope.set_tag("error_type", "intentional")
-            scope.set_context("request_info", {
-                "endpoint": "/error",
-                "method": "GET",
-                "intentional": True
-            })
-            
-            try:
-                raise ValueError("Intentional error for testing Sentry integration")
-            except ValueError as e:
-                sentry_sdk.capture_exception(e)
-                return jsonify({"error": "Simulated error"}), 500
+        try:
+            raise ValueError("Intentional error for testing Sentry integration")
+        except ValueError as e:
+            sentry_sdk.capture_exception(e)
+            return ERR_RESPONSE
 
 @app.route('/sentry-test')
 def sentry_test():
@@ -230,6 +587,12 @@ def sentry_test():
         "check_sentry_dashboard": "http://localhost:9000"
     })
 
+# Telemetry is initialized per process rather than at import: gunicorn calls
+# init_telemetry() from its post_fork hook (see gunicorn.conf.py) so every
+# worker owns its own processor threads and gRPC channel. Under any other
+# server the app still serves requests, it just exports no telemetry until
+# init_telemetry() is called.
 if __name__ == '__main__':
+    init_telemetry()
     logger.info("Starting Flask application on port 5000")
     app.run(host='0.0.0.0', port=5000)
@@ -0,0 +1,16 @@
+import os
+
+bind = "0.0.0.0:5000"
+# sched_getaffinity respects container cpusets, unlike cpu_count()
+workers = int(os.getenv("WEB_CONCURRENCY", len(os.sched_getaffinity(0))))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", 8))
+worker_tmp_dir = "/dev/shm"
+
+
+def post_fork(server, worker):
+    # OpenTelemetry's batch processors and metric reader start background
+    # threads, and gRPC channels must not be shared across fork, so each
+    # worker sets up its own telemetry after forking
+    from app import init_telemetry
+    init_telemetry()